@@ -4,8 +4,29 @@
 """
 import json
 import os
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Optional, Dict, Set
+
+try:
+    # 可选依赖：更快的 JSON 编解码
+    import orjson
+except ImportError:
+    orjson = None
+
+
+@dataclass(frozen=True)
+class ConfigView:
+    """配置快照（只读），供界面直接读取字段"""
+    smapi_path: Optional[str]
+    game_mods_path: Optional[str]
+    local_mods_path: str
+    existing_imported: bool
+    
+    @property
+    def is_configured(self) -> bool:
+        """是否已配置 SMAPI 路径和游戏 Mods 路径"""
+        return bool(self.smapi_path and self.game_mods_path)
 
 
 class ConfigManager:
@@ -19,8 +40,23 @@ class ConfigManager:
             config_file: 配置文件路径
         """
         self.config_file = Path(config_file)
-        self.config: Dict[str, str] = {}
-        self.load_config()
+        # 配置在首次访问时才加载
+        self._config: Optional[Dict[str, str]] = None
+        # 上次写入磁盘的序列化内容，用于跳过无变化的保存
+        self._last_serialized: Optional[bytes] = None
+        # 已确认存在的本地 Mods 目录，避免重复创建
+        self._ensured_local_mods: Set[str] = set()
+    
+    @property
+    def config(self) -> Dict[str, str]:
+        """配置字典（首次访问时加载配置文件）"""
+        if self._config is None:
+            self.load_config()
+        return self._config
+    
+    @config.setter
+    def config(self, value: Dict[str, str]):
+        self._config = value
     
     def load_config(self) -> Dict[str, str]:
         """
@@ -31,16 +67,33 @@ class ConfigManager:
         """
         if self.config_file.exists():
             try:
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    self.config = json.load(f)
+                if orjson is not None:
+                    self.config = orjson.loads(self.config_file.read_bytes())
+                else:
+                    with open(self.config_file, 'r', encoding='utf-8') as f:
+                        self.config = json.load(f)
+                self._last_serialized = self._serialize()
             except (json.JSONDecodeError, IOError) as e:
                 print(f"加载配置文件失败: {e}")
                 self.config = {}
+                self._last_serialized = None
         else:
             self.config = {}
+            self._last_serialized = None
         
         return self.config
     
+    def _serialize(self) -> bytes:
+        """
+        序列化当前配置
+        
+        Returns:
+            UTF-8 编码的 JSON 内容
+        """
+        if orjson is not None:
+            return orjson.dumps(self.config, option=orjson.OPT_INDENT_2)
+        return json.dumps(self.config, indent=4, ensure_ascii=False).encode('utf-8')
+    
     def save_config(self) -> bool:
         """
         保存配置文件
@@ -49,8 +102,16 @@ class ConfigManager:
             是否保存成功
         """
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=4, ensure_ascii=False)
+            data = self._serialize()
+            # 配置未变化时无需写入
+            if data == self._last_serialized:
+                return True
+            
+            # 先写入临时文件再替换，避免写入中断导致配置文件损坏
+            tmp_file = self.config_file.with_suffix('.tmp')
+            tmp_file.write_bytes(data)
+            os.replace(tmp_file, self.config_file)
+            self._last_serialized = data
             return True
         except IOError as e:
             print(f"保存配置文件失败: {e}")
@@ -82,8 +143,10 @@ class ConfigManager:
             本地 Mods 目录路径
         """
         local_path = self.config.get('local_mods_path', './mods')
-        # 确保目录存在
-        Path(local_path).mkdir(parents=True, exist_ok=True)
+        # 确保目录存在（每个路径只需创建一次）
+        if local_path not in self._ensured_local_mods:
+            Path(local_path).mkdir(parents=True, exist_ok=True)
+            self._ensured_local_mods.add(local_path)
         return local_path
     
     def set_paths(self, smapi_path: str, game_mods_path: str, local_mods_path: str = './mods') -> bool:
@@ -98,9 +161,34 @@ class ConfigManager:
         Returns:
             是否保存成功
         """
+        # SMAPI 路径可能位于符号链接（如 Steam 库）中，需要完整解析；
+        # Mods 目录只需转换为绝对路径，无需逐级解析
         self.config['smapi_path'] = str(Path(smapi_path).resolve())
-        self.config['game_mods_path'] = str(Path(game_mods_path).resolve())
-        self.config['local_mods_path'] = str(Path(local_mods_path).resolve())
+        self.config['last_smapi_hint'] = self.config['smapi_path']
+        self.config['game_mods_path'] = os.path.abspath(game_mods_path)
+        self.config['local_mods_path'] = os.path.abspath(local_mods_path)
+        return self.save_config()
+    
+    def get_last_smapi_hint(self) -> Optional[str]:
+        """
+        获取上次找到的 SMAPI 路径（重新配置或清除路径后仍保留）
+        
+        Returns:
+            上次找到的 SMAPI 路径，不存在则返回 None
+        """
+        return self.config.get('last_smapi_hint') or self.get_smapi_path()
+    
+    def set_last_smapi_hint(self, smapi_path: str) -> bool:
+        """
+        记录找到的 SMAPI 路径，供下次设置时直接使用
+        
+        Args:
+            smapi_path: StardewModdingAPI.exe 路径
+            
+        Returns:
+            是否保存成功
+        """
+        self.config['last_smapi_hint'] = smapi_path
         return self.save_config()
     
     def is_configured(self) -> bool:
@@ -133,3 +221,34 @@ class ConfigManager:
         """
         self.config['existing_mods_imported'] = value
         return self.save_config()
+    
+    def snapshot(self) -> ConfigView:
+        """
+        获取当前配置的只读快照（配置修改后需重新获取）
+        
+        Returns:
+            配置快照
+        """
+        return ConfigView(
+            smapi_path=self.get_smapi_path(),
+            game_mods_path=self.get_game_mods_path(),
+            # 只读取配置，目录由 ModManager 负责创建
+            local_mods_path=self.config.get('local_mods_path', './mods'),
+            existing_imported=self.has_imported_existing_mods(),
+        )
+
+
+_instance: Optional[ConfigManager] = None
+
+
+def get_config_manager() -> ConfigManager:
+    """
+    获取全局共享的配置管理器（首次调用时创建）
+    
+    Returns:
+        配置管理器
+    """
+    global _instance
+    if _instance is None:
+        _instance = ConfigManager()
+    return _instance
@@ -3,6 +3,7 @@
 负责查找 StardewModdingAPI.exe 的位置
 """
 import os
+import sys
 from pathlib import Path
 from typing import Optional, List
 
@@ -10,14 +11,25 @@ from typing import Optional, List
 class FileFinder:
     """文件查找器"""
     
+    # GetDriveTypeW 返回值：无效根目录、可移动磁盘（读卡器、U 盘）、光驱
+    _DRIVE_NO_ROOT_DIR = 1
+    _MEDIA_DRIVE_TYPES = (2, 5)
+    
     @staticmethod
-    def find_smapi_exe() -> Optional[str]:
+    def find_smapi_exe(hint: Optional[str] = None) -> Optional[str]:
         """
         在常见位置查找 StardewModdingAPI.exe
         
+        Args:
+            hint: 已知的 SMAPI 路径（如配置文件中保存的路径），有效时直接返回
+            
         Returns:
             StardewModdingAPI.exe 的路径，未找到返回 None
         """
+        # 已知路径仍然有效时无需搜索
+        if hint and os.path.isfile(hint):
+            return hint
+        
         # 常见的 Steam 游戏安装路径
         common_paths = [
             r"C:\Program Files (x86)\Steam\steamapps\common\Stardew Valley",
@@ -59,6 +71,27 @@ class FileFinder:
             盘符列表
         """
         drives = []
+        if sys.platform == 'win32':
+            # GetLogicalDrives 一次调用返回所有盘符的位掩码，固定磁盘无需逐个探测；
+            # 位掩码中也包含没有插入介质的读卡器和光驱，这类驱动器仍需确认介质存在
+            try:
+                import ctypes
+                kernel32 = ctypes.windll.kernel32
+                bitmask = kernel32.GetLogicalDrives()
+                for i in range(26):
+                    if not bitmask & (1 << i):
+                        continue
+                    letter = chr(ord('A') + i)
+                    drive_type = kernel32.GetDriveTypeW(f"{letter}:\\")
+                    if drive_type == FileFinder._DRIVE_NO_ROOT_DIR:
+                        continue
+                    if drive_type in FileFinder._MEDIA_DRIVE_TYPES and not os.path.exists(f"{letter}:"):
+                        continue
+                    drives.append(letter)
+                return drives
+            except Exception:
+                drives = []
+        
         for letter in 'ABCDEFGHIJKLMNOPQRSTUVWXYZ':
             drive = f"{letter}:"
             if os.path.exists(drive):
@@ -79,7 +112,7 @@ class FileFinder:
         smapi_dir = Path(smapi_path).parent
         mods_dir = smapi_dir / "Mods"
         
-        if mods_dir.exists() and mods_dir.is_dir():
+        if os.path.isdir(mods_dir):
             return str(mods_dir.resolve())
         
         # 如果不存在，尝试创建
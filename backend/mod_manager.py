@@ -2,18 +2,32 @@
 Mod 管理模块
 负责 Mod 的添加、启用、禁用等操作
 """
+import copy
 import os
 import shutil
+import threading
 import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Callable, List, Dict, Optional, Set, Tuple
 import json
-import re
+
+try:
+    # 可选依赖：C 扩展实现的 JSON5 解析器，可直接解析注释和尾随逗号
+    import pyjson5
+except ImportError:
+    pyjson5 = None
+
+# 已确认存在的目录，重复创建 ModManager 时无需再次 mkdir
+_ensured_dirs: Set[str] = set()
 
 
 class ModManager:
     """Mod 管理器"""
     
+    # 本身已压缩的文件类型，打包时直接存储，不再重复压缩
+    _STORED_SUFFIXES = {'.png', '.jpg', '.ogg', '.mp3', '.xnb', '.zip'}
+    
     def __init__(self, local_mods_path: str, game_mods_path: str):
         """
         初始化 Mod 管理器
@@ -25,9 +39,17 @@ class ModManager:
         self.local_mods_path = Path(local_mods_path)
         self.game_mods_path = Path(game_mods_path)
         
-        # 确保目录存在
-        self.local_mods_path.mkdir(parents=True, exist_ok=True)
-        self.game_mods_path.mkdir(parents=True, exist_ok=True)
+        # 压缩包内 Mod 根目录缓存，键为 (路径, 修改时间, 文件大小)，供统计数量和启用共用
+        self._zip_roots_cache: Dict[Tuple[str, int, int], List[str]] = {}
+        # 列表刷新在线程池中执行，启用 Mod 在界面线程中执行，两者共用缓存
+        self._cache_lock = threading.Lock()
+        
+        # 确保目录存在（同一路径在进程内只创建一次）
+        for path in (self.local_mods_path, self.game_mods_path):
+            key = str(path)
+            if key not in _ensured_dirs:
+                path.mkdir(parents=True, exist_ok=True)
+                _ensured_dirs.add(key)
     
     def list_local_mods(self) -> List[Dict[str, str]]:
         """
@@ -37,17 +59,48 @@ class ModManager:
             Mod 列表，每个元素包含 name、filename、path、enabled 和 mod_count
         """
         mods = []
+        roots_cache = {}
+        enabled_dirs = self._list_enabled_dir_names()
         for file in self.local_mods_path.glob("*.zip"):
-            mod_count = self._count_mods_in_zip(file)
+            try:
+                st = file.stat()
+            except OSError:
+                # 列出后已被删除或是失效的符号链接，跳过
+                continue
+            key = (str(file), st.st_mtime_ns, st.st_size)
+            with self._cache_lock:
+                mod_roots = self._zip_roots_cache.get(key)
+            if mod_roots is None:
+                mod_roots = self._read_zip_mod_roots(file)
+            if mod_roots is not None:
+                roots_cache[key] = mod_roots
             mods.append({
                 'name': file.stem,
                 'filename': file.name,
                 'path': str(file),
-                'enabled': self._is_mod_enabled(file.stem),
-                'mod_count': mod_count  # 压缩包中包含的 Mod 数量
+                'enabled': os.path.normcase(file.stem) in enabled_dirs,
+                'mod_count': len(mod_roots or ()) or 1  # 压缩包中包含的 Mod 数量
             })
+        
+        # 只保留本次仍存在的压缩包，避免缓存无限增长
+        with self._cache_lock:
+            self._zip_roots_cache = roots_cache
         return mods
     
+    def _list_enabled_dir_names(self) -> Set[str]:
+        """
+        一次性列出游戏 Mods 目录中的所有主目录名
+        
+        Returns:
+            目录名集合（已通过 os.path.normcase 规范化大小写）
+        """
+        if not os.path.isdir(self.game_mods_path):
+            return set()
+        
+        # 一次目录读取即可得到所有主目录，目录类型取自目录项缓存
+        with os.scandir(self.game_mods_path) as it:
+            return {os.path.normcase(entry.name) for entry in it if entry.is_dir()}
+    
     def list_enabled_mods(self) -> List[str]:
         """
         列出所有已启用的 Mod（游戏 Mods 目录中的文件夹）
@@ -75,37 +128,66 @@ class ModManager:
         """
         # 检查游戏 Mods 目录中是否存在以压缩包名命名的主目录
         main_dir = self.game_mods_path / mod_name
-        return main_dir.exists() and main_dir.is_dir()
+        return os.path.isdir(main_dir)
     
-    def _count_mods_in_zip(self, zip_path: Path) -> int:
+    def _read_zip_mod_roots(self, zip_path: Path) -> Optional[List[str]]:
         """
-        统计压缩包中包含的 Mod 数量
+        读取压缩包中的 Mod 根目录（只读取中央目录，无需解压）
         
         Args:
             zip_path: 压缩包路径
             
         Returns:
-            Mod 数量
+            Mod 根目录前缀列表，读取失败时返回 None
         """
         try:
-            temp_dir = self.local_mods_path / f"_count_{zip_path.stem}"
-            if temp_dir.exists():
-                shutil.rmtree(temp_dir)
-            temp_dir.mkdir()
-            
             with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                zip_ref.extractall(temp_dir)
-            
-            mod_roots = self._find_all_mod_roots(temp_dir)
-            count = len(mod_roots)
+                return self._find_zip_mod_roots(zip_ref.namelist())
+        except Exception:
+            return None
+    
+    def _zip_roots_key(self, zip_path: Path) -> Tuple[str, int, int]:
+        """
+        获取 Mod 根目录缓存的键，文件修改后自动失效
+        
+        Args:
+            zip_path: 压缩包路径
             
-            # 清理临时目录
-            if temp_dir.exists():
-                shutil.rmtree(temp_dir)
+        Returns:
+            (路径, 修改时间, 文件大小)
+        """
+        st = os.stat(zip_path)
+        return (str(zip_path), st.st_mtime_ns, st.st_size)
+    
+    def _find_zip_mod_roots(self, names: List[str]) -> List[str]:
+        """
+        根据压缩包内的文件名列表查找所有 Mod 根目录（包含 manifest.json 的目录）
+        查找规则与 _find_all_mod_roots 保持一致
+        
+        Args:
+            names: 压缩包内的文件名列表
             
-            return count
-        except Exception:
-            return 1  # 出错时默认返回 1
+        Returns:
+            Mod 根目录前缀列表，压缩包根目录即为 Mod 时返回 ['']
+        """
+        roots = set()
+        for name in names:
+            # Windows 文件系统不区分大小写，SMAPI 同样能加载 Manifest.json 等写法
+            prefix, _, basename = name.rpartition('/')
+            if basename.lower() != 'manifest.json':
+                continue
+            if not prefix:
+                return ['']
+            # 最多查找四层目录
+            if prefix.count('/') <= 3:
+                roots.add(prefix)
+        
+        # 已找到的 Mod 目录下不再继续查找
+        mod_roots = []
+        for root in sorted(roots):
+            if not any(root.startswith(parent + '/') for parent in mod_roots):
+                mod_roots.append(root)
+        return mod_roots
     
     def add_mod(self, source_path: str) -> bool:
         """
@@ -119,7 +201,7 @@ class ModManager:
         """
         try:
             source = Path(source_path)
-            if not source.exists():
+            if not os.path.isfile(source):
                 print(f"文件不存在: {source_path}")
                 return False
             
@@ -129,7 +211,27 @@ class ModManager:
             
             # 复制到本地 Mods 目录
             destination = self.local_mods_path / source.name
-            shutil.copy2(source, destination)
+            if destination.exists() and os.path.samefile(source, destination):
+                # 已是同一文件（例如之前以硬链接方式添加过），无需处理
+                print(f"Mod 已添加: {source.name}")
+                return True
+            
+            # 先写入临时文件再替换，替换前旧版本始终保留，失败时也不会丢失
+            # （临时文件名不以 .zip 结尾，列表刷新时不会被当作 Mod）
+            temp_path = self.local_mods_path / f".{source.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+            try:
+                try:
+                    # 同一文件系统上优先创建硬链接，无需复制文件内容
+                    os.link(source, temp_path)
+                except OSError:
+                    # 跨设备或不支持硬链接时回退为复制
+                    # （shutil 在支持的平台上会使用 sendfile/fcopyfile 等内核快速复制）
+                    shutil.copy2(source, temp_path)
+                os.replace(temp_path, destination)
+            except Exception:
+                if os.path.lexists(temp_path):
+                    os.unlink(temp_path)
+                raise
             print(f"Mod 已添加: {source.name}")
             return True
             
@@ -137,6 +239,38 @@ class ModManager:
             print(f"添加 Mod 失败: {e}")
             return False
     
+    def add_mods(self, source_paths: List[str],
+                 progress_cb: Optional[Callable[[int, int, str], None]] = None) -> Dict[str, int]:
+        """
+        批量添加 Mod 到本地存储
+        各文件互不依赖，复制时主要等待磁盘 I/O，使用线程池并行处理
+        
+        Args:
+            source_paths: Mod 压缩包源路径列表
+            progress_cb: 进度回调，每处理完一个文件调用一次，参数为 (已完成数, 总数, 文件名)
+            
+        Returns:
+            包含添加结果的字典 {success: int, failed: int}
+        """
+        result = {'success': 0, 'failed': 0}
+        total = len(source_paths)
+        if not total:
+            return result
+        
+        max_workers = min(16, (os.cpu_count() or 1) * 4, total)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(self.add_mod, path): path for path in source_paths}
+            for future in as_completed(futures):
+                if future.result():
+                    result['success'] += 1
+                else:
+                    result['failed'] += 1
+                
+                if progress_cb:
+                    progress_cb(result['success'] + result['failed'], total, Path(futures[future]).name)
+        
+        return result
+    
     def enable_mod(self, mod_filename: str) -> bool:
         """
         启用 Mod（解压到游戏 Mods 目录）
@@ -150,7 +284,7 @@ class ModManager:
         """
         try:
             mod_path = self.local_mods_path / mod_filename
-            if not mod_path.exists():
+            if not os.path.isfile(mod_path):
                 print(f"Mod 文件不存在: {mod_filename}")
                 return False
             
@@ -159,65 +293,61 @@ class ModManager:
             main_dir = self.game_mods_path / mod_name
             
             # 如果已启用，先删除
-            if main_dir.exists():
+            if os.path.isdir(main_dir):
                 shutil.rmtree(main_dir)
             
-            # 解压到临时目录
-            temp_dir = self.local_mods_path / f"_temp_{mod_name}"
-            if temp_dir.exists():
-                shutil.rmtree(temp_dir)
-            temp_dir.mkdir()
-            
+            roots_key = self._zip_roots_key(mod_path)
             with zipfile.ZipFile(mod_path, 'r') as zip_ref:
-                zip_ref.extractall(temp_dir)
-            
-            # 查找所有的 Mod 根目录（包含 manifest.json 的目录）
-            mod_roots = self._find_all_mod_roots(temp_dir)
-            if not mod_roots:
-                print(f"未找到有效的 Mod 结构（缺少 manifest.json）")
-                shutil.rmtree(temp_dir)
-                return False
-            
-            # 创建主目录
-            main_dir.mkdir(parents=True, exist_ok=True)
-            
-            # 根据 mod 数量决定目录结构
-            if len(mod_roots) == 1:
+                # 查找所有的 Mod 根目录（包含 manifest.json 的目录），列表刷新时已统计过则直接复用
+                with self._cache_lock:
+                    mod_roots = self._zip_roots_cache.get(roots_key)
+                if mod_roots is None:
+                    mod_roots = self._find_zip_mod_roots(zip_ref.namelist())
+                    with self._cache_lock:
+                        self._zip_roots_cache[roots_key] = mod_roots
+                if not mod_roots:
+                    print(f"未找到有效的 Mod 结构（缺少 manifest.json）")
+                    return False
+                
+                # 根据 mod 数量决定目录结构：
                 # 单个 mod：主目录下直接是 mod 文件（manifest.json 等）
-                mod_root = mod_roots[0]
-                for item in mod_root.iterdir():
-                    dest = main_dir / item.name
-                    if dest.exists():
-                        if dest.is_dir():
-                            shutil.rmtree(dest)
+                # 多个 mod：主目录下是各个 mod 的文件夹
+                if len(mod_roots) == 1:
+                    targets = {mod_roots[0]: ''}
+                else:
+                    targets = {root: root.rsplit('/', 1)[-1] + '/' for root in mod_roots}
+                
+                # 创建主目录
+                main_dir.mkdir(parents=True, exist_ok=True)
+                
+                # 直接将各文件解压到最终位置，Mod 根目录之外的文件不解压
+                for info in zip_ref.infolist():
+                    for root, dest_prefix in targets.items():
+                        if not root:
+                            relative = info.filename
+                        elif info.filename.startswith(root + '/'):
+                            relative = info.filename[len(root) + 1:]
                         else:
-                            dest.unlink()
-                    shutil.move(str(item), str(dest))
+                            continue
+                        
+                        if relative or dest_prefix:
+                            member = copy.copy(info)
+                            member.filename = dest_prefix + relative
+                            zip_ref.extract(member, main_dir)
+                        break
+            
+            if len(mod_roots) == 1:
                 print(f"Mod 已启用: {mod_name}（单个 Mod）")
             else:
-                # 多个 mod：主目录下是各个 mod 的文件夹
-                for mod_root in mod_roots:
-                    mod_folder_name = mod_root.name
-                    dest = main_dir / mod_folder_name
-                    if dest.exists():
-                        shutil.rmtree(dest)
-                    shutil.move(str(mod_root), str(dest))
                 print(f"Mod 已启用: {mod_name}（包含 {len(mod_roots)} 个 Mod）")
-                for mod_root in mod_roots:
-                    print(f"  - {mod_root.name}")
-            
-            # 清理临时目录
-            if temp_dir.exists():
-                shutil.rmtree(temp_dir)
+                for root in mod_roots:
+                    print(f"  - {root.rsplit('/', 1)[-1]}")
             
             return True
             
         except Exception as e:
             print(f"启用 Mod 失败: {e}")
-            # 清理临时目录和可能创建的主目录
-            temp_dir = self.local_mods_path / f"_temp_{Path(mod_filename).stem}"
-            if temp_dir.exists():
-                shutil.rmtree(temp_dir)
+            # 清理可能创建的主目录
             main_dir = self.game_mods_path / Path(mod_filename).stem
             if main_dir.exists():
                 shutil.rmtree(main_dir)
@@ -236,7 +366,7 @@ class ModManager:
         """
         try:
             main_dir = self.game_mods_path / mod_name
-            if not main_dir.exists():
+            if not os.path.isdir(main_dir):
                 print(f"Mod 未启用: {mod_name}")
                 return False
             
@@ -279,28 +409,30 @@ class ModManager:
         mod_roots = []
         
         # 检查当前目录
-        if (extract_path / "manifest.json").exists():
+        if os.path.isfile(os.path.join(extract_path, "manifest.json")):
             mod_roots.append(extract_path)
             return mod_roots
         
-        # 递归查找所有包含 manifest.json 的目录（最多三层）
-        def find_in_dir(path: Path, depth: int = 0, max_depth: int = 3):
-            if depth > max_depth:
-                return
-            
+        # 查找所有包含 manifest.json 的目录（最多四层）
+        # 使用 os.scandir 迭代遍历，目录类型直接取自目录项缓存
+        max_depth = 3
+        stack = [(str(extract_path), 0)]
+        while stack:
+            path, depth = stack.pop()
             try:
-                for item in path.iterdir():
-                    if item.is_dir():
+                with os.scandir(path) as it:
+                    for entry in it:
+                        if not entry.is_dir():
+                            continue
                         # 如果找到 manifest.json，添加到列表
-                        if (item / "manifest.json").exists():
-                            mod_roots.append(item)
-                        else:
+                        if os.path.isfile(os.path.join(entry.path, "manifest.json")):
+                            mod_roots.append(Path(entry.path))
+                        elif depth < max_depth:
                             # 继续在子目录中查找
-                            find_in_dir(item, depth + 1, max_depth)
+                            stack.append((entry.path, depth + 1))
             except (PermissionError, OSError):
                 pass
         
-        find_in_dir(extract_path)
         return mod_roots
     
     def _load_json_with_comments(self, file_path: Path) -> dict:
@@ -317,20 +449,70 @@ class ModManager:
             with open(file_path, 'r', encoding='utf-8') as f:
                 content = f.read()
             
-            # 移除单行注释 // ...
-            content = re.sub(r'//.*?$', '', content, flags=re.MULTILINE)
-            
-            # 移除多行注释 /* ... */
-            content = re.sub(r'/\*.*?\*/', '', content, flags=re.DOTALL)
-            
-            # 移除尾随逗号（JSON 不允许，但 SMAPI 允许）
-            content = re.sub(r',(\s*[}\]])', r'\1', content)
+            if pyjson5 is not None:
+                return pyjson5.decode(content)
             
-            return json.loads(content)
+            return json.loads(self._strip_json_comments(content))
         except Exception as e:
             print(f"解析 JSON 文件失败 ({file_path}): {e}")
             raise
     
+    @staticmethod
+    def _strip_json_comments(content: str) -> str:
+        """
+        单次扫描移除 JSON 中的注释和尾随逗号（JSON 不允许，但 SMAPI 允许）
+        字符串内的内容保持不变
+        
+        Args:
+            content: 原始 JSON 文本
+            
+        Returns:
+            可被 json.loads 解析的文本
+        """
+        chunks = []
+        start = 0
+        comma = -1  # 尚未确认的逗号在 chunks 中的下标
+        i = 0
+        n = len(content)
+        while i < n:
+            c = content[i]
+            if c == '"':
+                # 跳过字符串（包括转义字符）
+                i += 1
+                while i < n and content[i] != '"':
+                    i += 2 if content[i] == '\\' else 1
+                i += 1
+                comma = -1
+            elif c == '/' and content.startswith('//', i):
+                # 单行注释 // ...
+                chunks.append(content[start:i])
+                end = content.find('\n', i)
+                i = start = n if end == -1 else end
+            elif c == '/' and content.startswith('/*', i):
+                # 多行注释 /* ... */
+                chunks.append(content[start:i])
+                end = content.find('*/', i + 2)
+                i = start = n if end == -1 else end + 2
+            elif c == ',':
+                chunks.append(content[start:i])
+                chunks.append(',')
+                comma = len(chunks) - 1
+                i += 1
+                start = i
+            elif c == '}' or c == ']':
+                # 逗号之后直接是结束括号，说明是尾随逗号
+                if comma >= 0:
+                    chunks[comma] = ''
+                    comma = -1
+                i += 1
+            else:
+                if c not in ' \t\r\n':
+                    comma = -1
+                i += 1
+        
+        chunks.append(content[start:])
+        return ''.join(chunks)
+    
     def _get_mod_name_from_manifest(self, mod_root: Path) -> Optional[str]:
         """
         从 manifest.json 获取 Mod 的 UniqueID
@@ -365,7 +547,7 @@ class ModManager:
         """
         try:
             mod_path = self.local_mods_path / mod_filename
-            if not mod_path.exists():
+            if not os.path.isfile(mod_path):
                 print(f"Mod 文件不存在: {mod_filename}")
                 return False
             
@@ -377,79 +559,149 @@ class ModManager:
             print(f"删除 Mod 失败: {e}")
             return False
     
-    def import_existing_mods(self) -> Dict[str, any]:
+    def import_existing_mods(self, progress_cb: Optional[Callable[[int, int, str], None]] = None,
+                             cancel_cb: Optional[Callable[[], bool]] = None) -> Dict[str, any]:
         """
         导入游戏目录中已有的 Mod（首次使用时调用）
         将已存在的 Mod 文件夹打包成 ZIP 并保存到本地库
         
+        Args:
+            progress_cb: 进度回调，每打包完成一个 Mod 调用一次，参数为 (已完成数, 总数, Mod 名称)
+            cancel_cb: 取消检查，返回 True 时不再开始打包剩余的 Mod（正在打包的会完成）
+            
         Returns:
-            包含导入结果的字典 {success: int, failed: int, mods: List[str]}
+            包含导入结果的字典 {success: int, failed: int, mods: List[str], cancelled: bool}
         """
         result = {
             'success': 0,
             'failed': 0,
             'mods': [],
-            'errors': []
+            'errors': [],
+            'cancelled': False
         }
         
         if not self.game_mods_path.exists():
             return result
         
+        # 待打包的 Mod：(名称, 文件夹路径, 目标 ZIP 路径)
+        candidates = []
+        
         # 遍历游戏 Mods 目录中的所有文件夹
-        for item in self.game_mods_path.iterdir():
-            if not item.is_dir():
-                continue
-            
-            mod_name = item.name
-            
-            # 跳过系统文件夹或特殊文件夹
-            if mod_name.startswith('.') or mod_name.startswith('_'):
-                continue
-            
-            # 检查是否包含 manifest.json
-            manifest_path = item / "manifest.json"
-            if not manifest_path.exists():
-                print(f"跳过 '{mod_name}'：缺少 manifest.json")
-                continue
-            
-            # 检查是否已经在本地库中
-            zip_filename = f"{mod_name}.zip"
-            local_zip_path = self.local_mods_path / zip_filename
-            
-            if local_zip_path.exists():
-                print(f"跳过 '{mod_name}'：本地库中已存在")
-                result['mods'].append(mod_name)
-                continue
-            
-            # 打包 Mod 文件夹
-            try:
-                print(f"正在导入 Mod: {mod_name}")
+        with os.scandir(self.game_mods_path) as it:
+            for entry in it:
+                if not entry.is_dir():
+                    continue
                 
-                # 创建 ZIP 文件
-                with zipfile.ZipFile(local_zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                    # 递归添加文件夹中的所有文件
-                    for root, dirs, files in os.walk(item):
-                        for file in files:
-                            file_path = Path(root) / file
-                            # 计算相对路径（保持文件夹结构）
-                            arcname = file_path.relative_to(item.parent)
-                            zipf.write(file_path, arcname)
+                mod_name = entry.name
                 
-                result['success'] += 1
-                result['mods'].append(mod_name)
-                print(f"成功导入: {mod_name}")
+                # 跳过系统文件夹或特殊文件夹
+                if mod_name.startswith('.') or mod_name.startswith('_'):
+                    continue
                 
-            except Exception as e:
-                result['failed'] += 1
-                error_msg = f"{mod_name}: {str(e)}"
-                result['errors'].append(error_msg)
-                print(f"导入 Mod '{mod_name}' 失败: {e}")
+                # 检查是否包含 manifest.json
+                if not os.path.isfile(os.path.join(entry.path, 'manifest.json')):
+                    print(f"跳过 '{mod_name}'：缺少 manifest.json")
+                    continue
+                
+                # 检查是否已经在本地库中
+                zip_filename = f"{mod_name}.zip"
+                local_zip_path = self.local_mods_path / zip_filename
                 
-                # 删除可能创建的不完整文件
                 if local_zip_path.exists():
-                    try:
-                        local_zip_path.unlink()
-                    except:
-                        pass
+                    print(f"跳过 '{mod_name}'：本地库中已存在")
+                    result['mods'].append(mod_name)
+                    continue
+                
+                candidates.append((mod_name, Path(entry.path), local_zip_path))
+        
+        if not candidates:
+            return result
+        
+        # 并行打包各个 Mod 文件夹（zlib 压缩时会释放 GIL）
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            futures = {
+                executor.submit(self._zip_mod_folder, item, local_zip_path): (mod_name, local_zip_path)
+                for mod_name, item, local_zip_path in candidates
+            }
+            
+            # 按完成顺序统计，较大的 Mod 不会阻塞其他 Mod 的进度
+            for current, future in enumerate(as_completed(futures), 1):
+                mod_name, local_zip_path = futures[future]
+                if future.cancelled():
+                    continue
+                try:
+                    future.result()
+                    result['success'] += 1
+                    result['mods'].append(mod_name)
+                    print(f"成功导入: {mod_name}")
+                    
+                except Exception as e:
+                    result['failed'] += 1
+                    error_msg = f"{mod_name}: {str(e)}"
+                    result['errors'].append(error_msg)
+                    print(f"导入 Mod '{mod_name}' 失败: {e}")
+                    
+                    # 删除可能创建的不完整文件
+                    if local_zip_path.exists():
+                        try:
+                            local_zip_path.unlink()
+                        except:
+                            pass
+                
+                if progress_cb:
+                    progress_cb(current, len(futures), mod_name)
+                
+                if cancel_cb is not None and not result['cancelled'] and cancel_cb():
+                    # 取消尚未开始的打包任务
+                    result['cancelled'] = True
+                    for pending in futures:
+                        pending.cancel()
         
-        return result
\ No newline at end of file
+        # 完成顺序不固定，按名称排序使结果稳定
+        result['mods'].sort()
+        result['errors'].sort()
+        return result
+    
+    def _zip_mod_folder(self, mod_dir: Path, zip_path: Path) -> None:
+        """
+        将 Mod 文件夹打包成 ZIP（保持文件夹结构）
+        
+        Args:
+            mod_dir: Mod 文件夹路径
+            zip_path: 目标 ZIP 文件路径
+        """
+        print(f"正在导入 Mod: {mod_dir.name}")
+        
+        # 相对路径以 Mod 文件夹的上级目录为基准（保持文件夹结构）
+        prefix_len = len(os.path.join(str(mod_dir.parent), ''))
+        
+        # 创建 ZIP 文件（使用最快的压缩级别）
+        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as zipf:
+            # 递归添加文件夹中的所有文件
+            for file_path in self._iter_files(str(mod_dir)):
+                arcname = file_path[prefix_len:]
+                if os.path.splitext(file_path)[1].lower() in self._STORED_SUFFIXES:
+                    zipf.write(file_path, arcname, compress_type=zipfile.ZIP_STORED)
+                else:
+                    zipf.write(file_path, arcname)
+    
+    @staticmethod
+    def _iter_files(root: str):
+        """
+        使用 os.scandir 递归遍历目录下的所有文件
+        与 os.walk 一致，不进入指向目录的符号链接
+        
+        Args:
+            root: 起始目录
+            
+        Yields:
+            文件路径
+        """
+        stack = [root]
+        while stack:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif not entry.is_dir():
+                        yield entry.path
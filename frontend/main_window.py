@@ -3,69 +3,315 @@
 """
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-    QPushButton, QListWidget, QLabel, QMessageBox,
-    QFileDialog, QListWidgetItem, QSplitter
+    QPushButton, QListView, QLabel, QMessageBox,
+    QFileDialog, QSplitter, QProgressDialog
+)
+from PyQt6.QtCore import (
+    Qt, QThread, QTimer, pyqtSignal, QUrl, QAbstractListModel, QModelIndex,
+    QFileSystemWatcher, QSize, QObject, QRunnable, QThreadPool, QElapsedTimer
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QUrl
 from PyQt6.QtGui import QIcon, QDragEnterEvent, QDropEvent
 from pathlib import Path
+import os
 import sys
 
-from backend.config_manager import ConfigManager
-from backend.file_finder import FileFinder
-from backend.mod_manager import ModManager
-from .setup_dialog import SetupDialog
+from backend.config_manager import get_config_manager
+
+
+# 已启用 Mod 的显示标记
+_ENABLED_SUFFIX = " [已启用]"
+
+
+class ModRefreshSignals(QObject):
+    """Mod 列表刷新任务的信号"""
+    loaded = pyqtSignal(list, list)
+    failed = pyqtSignal(str)
+    finished = pyqtSignal()
+
+
+class ModRefreshTask(QRunnable):
+    """Mod 列表刷新任务（在全局线程池中运行）"""
+    
+    def __init__(self, mod_manager):
+        super().__init__()
+        self.mod_manager = mod_manager
+        self.signals = ModRefreshSignals()
+    
+    def run(self):
+        try:
+            local_mods = self.mod_manager.list_local_mods()
+            enabled_mods = self.mod_manager.list_enabled_mods()
+            self.signals.loaded.emit(local_mods, enabled_mods)
+        except Exception as e:
+            # 异常不能离开 QRunnable.run()，否则 PyQt 会直接终止程序
+            print(f"刷新 Mod 列表失败: {e}")
+            self.signals.failed.emit(str(e))
+        finally:
+            self.signals.finished.emit()
+
+
+def _is_zip(path):
+    """
+    判断路径是否为 ZIP 文件（只比较扩展名，不转换整个路径的大小写）
+    
+    Args:
+        path: 文件路径
+        
+    Returns:
+        是否为 ZIP 文件
+    """
+    return path[-4:].lower() == '.zip'
+
+
+def _format_mod(mod):
+    """
+    构建本地 Mod 的显示文本
+    
+    Args:
+        mod: list_local_mods 返回的 Mod 信息
+        
+    Returns:
+        显示文本
+    """
+    mod_count = mod.get('mod_count', 1)
+    return ''.join((
+        mod['name'],
+        # 如果包含多个 Mod，显示数量
+        f" ({mod_count} 个Mod)" if mod_count > 1 else '',
+        # 如果已启用，添加标记
+        _ENABLED_SUFFIX if mod['enabled'] else '',
+    ))
+
+
+class AddModsThread(QThread):
+    """批量添加 Mod 的线程"""
+    progress = pyqtSignal(int, int, str)
+    done = pyqtSignal(int, int)
+    
+    # 进度信号的最小发送间隔（毫秒），大量文件时避免无用的界面刷新
+    PROGRESS_INTERVAL_MS = 50
+    
+    def __init__(self, mod_manager, file_paths):
+        super().__init__()
+        self.mod_manager = mod_manager
+        self.file_paths = file_paths
+        self._timer = QElapsedTimer()
+        self._last_emit = 0
+    
+    def run(self):
+        self._timer.start()
+        self._last_emit = -self.PROGRESS_INTERVAL_MS
+        result = self.mod_manager.add_mods(self.file_paths, self._report_progress)
+        self.done.emit(result['success'], result['failed'])
+    
+    def _report_progress(self, done, total, name):
+        """节流发送进度，最后一个文件总是发送"""
+        now = self._timer.elapsed()
+        if now - self._last_emit >= self.PROGRESS_INTERVAL_MS or done == total:
+            self._last_emit = now
+            self.progress.emit(done, total, name)
 
 
-class ModRefreshThread(QThread):
-    """Mod 列表刷新线程"""
-    finished = pyqtSignal(list)
+class ImportExistingThread(QThread):
+    """导入现有 Mod 的线程（结果在 finished 信号发出后从 result 读取）"""
+    progress = pyqtSignal(int, int, str)
     
     def __init__(self, mod_manager):
         super().__init__()
         self.mod_manager = mod_manager
+        self.result = None
+        self._cancelled = False
+    
+    def cancel(self):
+        """请求取消，正在打包的 Mod 完成后停止"""
+        self._cancelled = True
     
     def run(self):
-        mods = self.mod_manager.list_local_mods()
-        self.finished.emit(mods)
+        try:
+            self.result = self.mod_manager.import_existing_mods(
+                self.progress.emit, lambda: self._cancelled
+            )
+        except Exception as e:
+            print(f"导入现有 Mod 失败: {e}")
+
+
+class ModListModel(QAbstractListModel):
+    """Mod 列表数据模型，整体替换数据，避免逐项插入"""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._mods = []
+        self._display = []
+        self._size_hint = None
+    
+    def set_row_height(self, height):
+        """
+        设置固定行高，视图无需再根据字体计算每行尺寸
+        
+        Args:
+            height: 行高（像素）
+        """
+        self._size_hint = QSize(0, height)
+    
+    def reset(self, mods, display=None):
+        """
+        替换全部数据
+        
+        Args:
+            mods: 每行对应的数据
+            display: 每行的显示文本，默认使用数据本身
+        """
+        self.beginResetModel()
+        self._mods = mods
+        self._display = display if display is not None else mods
+        self.endResetModel()
+    
+    def mod_at(self, row):
+        """
+        获取指定行的数据（直接读取 Python 列表，不经过 data() 角色转换）
+        
+        Args:
+            row: 行号
+            
+        Returns:
+            该行对应的数据
+        """
+        return self._mods[row]
+    
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._mods)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._display[index.row()]
+        if role == Qt.ItemDataRole.SizeHintRole:
+            return self._size_hint
+        return None
 
 
 class MainWindow(QMainWindow):
     """主窗口"""
     
-    def __init__(self):
+    def __init__(self, deferred: bool = False):
+        """
+        初始化主窗口
+        
+        Args:
+            deferred: 是否推迟读取配置和文件系统的初始化，
+                      为 True 时需在窗口显示后调用 post_show_init
+        """
         super().__init__()
-        self.config_manager = ConfigManager()
+        self.config_manager = get_config_manager()
+        # 配置快照，在 post_show_init 中首次获取
+        self.cfg = None
         self.mod_manager = None
         
+        # 刷新请求合并：同一轮事件循环内的多次刷新只执行一次，窗口隐藏时推迟到显示后
+        self._refresh_pending = False
+        self._refresh_scheduled = False
+        # 在全局线程池中读取 Mod 列表
+        self._refresh_task = None
+        self._refresh_running = False
+        # Mod 列表缓存，两个 Mods 目录的修改时间未变化时直接复用
+        self._mod_cache = None
+        self._mod_cache_key = None
+        self._loading_cache_key = None
+        # 缓存失效计数，后台刷新期间发生失效时不保存本次结果的缓存键
+        self._mod_cache_generation = 0
+        self._loading_generation = 0
+        # 最近一次刷新得到的已启用 Mod 索引 {小写名称: 实际名称}
+        self._enabled_by_lower = {}
+        # 拖放添加 Mod 的后台线程
+        self._add_thread = None
+        # 导入现有 Mod 的后台线程及进度对话框
+        self._import_thread = None
+        self._import_progress = None
+        # 监视两个 Mods 目录，文件变化时自动刷新
+        self._fs_watch = None
+        # 信息标签文本缓存
+        self._cached_info_text = None
+        
+        self.init_ui()
+        
+        if not deferred:
+            self.post_show_init()
+    
+    def post_show_init(self):
+        """完成需要读取配置和文件系统的初始化（窗口显示后调用时事件循环已在运行）"""
+        self._update_config_snapshot()
+        
         # 检查是否首次启动
-        if not self.config_manager.is_configured():
+        if not self.cfg.is_configured:
             self.show_setup_dialog()
         
         # 初始化 Mod 管理器
-        if self.config_manager.is_configured():
+        if self.cfg.is_configured:
             self.init_mod_manager()
             
             # 检查是否需要导入现有 Mod
-            if not self.config_manager.has_imported_existing_mods():
+            if not self.cfg.existing_imported:
                 self.import_existing_mods()
         
-        self.init_ui()
+        self.update_info_label()
         self.refresh_mod_list()
     
+    def _update_config_snapshot(self):
+        """重新获取配置快照（配置修改后调用）"""
+        self.cfg = self.config_manager.snapshot()
+        # 路径可能已变化，信息标签需重新生成
+        self._cached_info_text = None
+    
     def init_mod_manager(self):
         """初始化 Mod 管理器"""
-        local_mods_path = self.config_manager.get_local_mods_path()
-        game_mods_path = self.config_manager.get_game_mods_path()
+        from backend.mod_manager import ModManager
+        
+        local_mods_path = self.cfg.local_mods_path
+        game_mods_path = self.cfg.game_mods_path
         
         if local_mods_path and game_mods_path:
             self.mod_manager = ModManager(local_mods_path, game_mods_path)
+            self._invalidate_mod_cache()
+            self._watch_mod_dirs()
+    
+    def _watch_mod_dirs(self):
+        """监视本地和游戏 Mods 目录"""
+        if self._fs_watch is None:
+            self._fs_watch = QFileSystemWatcher(self)
+            self._fs_watch.directoryChanged.connect(self._on_fs_changed)
+        else:
+            watched = self._fs_watch.directories()
+            if watched:
+                self._fs_watch.removePaths(watched)
+        
+        self._fs_watch.addPaths([
+            str(self.mod_manager.local_mods_path),
+            str(self.mod_manager.game_mods_path),
+        ])
+    
+    def _on_fs_changed(self, path):
+        """Mods 目录发生变化"""
+        self._invalidate_mod_cache()
+        self.refresh_mod_list()
+    
+    def _on_mods_changed(self):
+        """Mod 操作完成后调用：目录处于监视中时由监视器触发刷新，否则立即刷新"""
+        self._invalidate_mod_cache()
+        if self._fs_watch is None or len(self._fs_watch.directories()) < 2:
+            self.refresh_mod_list()
     
     def show_setup_dialog(self):
         """显示首次设置对话框"""
+        from .setup_dialog import SetupDialog
+        
         dialog = SetupDialog(self.config_manager)
         if dialog.exec() == dialog.DialogCode.Accepted:
+            self._update_config_snapshot()
             self.init_mod_manager()
+            self.update_info_label()
         else:
             # 用户取消设置，退出程序
             QMessageBox.critical(self, "错误", "未完成初始设置，程序将退出")
@@ -89,7 +335,6 @@ class MainWindow(QMainWindow):
         # 顶部信息栏
         info_layout = QHBoxLayout()
         self.info_label = QLabel()
-        self.update_info_label()
         info_layout.addWidget(self.info_label)
         info_layout.addStretch()
         
@@ -111,8 +356,11 @@ class MainWindow(QMainWindow):
         hint_label.setStyleSheet("color: #666; font-style: italic;")
         left_layout.addWidget(hint_label)
         
-        self.local_mods_list = QListWidget()
-        self.local_mods_list.setSelectionMode(QListWidget.SelectionMode.SingleSelection)
+        self.local_model = ModListModel(self)
+        self.local_mods_list = QListView()
+        self.local_mods_list.setSelectionMode(QListView.SelectionMode.SingleSelection)
+        self.local_mods_list.setModel(self.local_model)
+        self._setup_list_view(self.local_mods_list)
         left_layout.addWidget(self.local_mods_list)
         
         # 本地 Mod 操作按钮
@@ -142,8 +390,11 @@ class MainWindow(QMainWindow):
         
         right_layout.addWidget(QLabel("已启用 Mod 列表"))
         
-        self.enabled_mods_list = QListWidget()
-        self.enabled_mods_list.setSelectionMode(QListWidget.SelectionMode.SingleSelection)
+        self.enabled_model = ModListModel(self)
+        self.enabled_mods_list = QListView()
+        self.enabled_mods_list.setSelectionMode(QListView.SelectionMode.SingleSelection)
+        self.enabled_mods_list.setModel(self.enabled_model)
+        self._setup_list_view(self.enabled_mods_list)
         right_layout.addWidget(self.enabled_mods_list)
         
         # 已启用 Mod 操作按钮
@@ -154,7 +405,7 @@ class MainWindow(QMainWindow):
         enabled_btn_layout.addWidget(disable_btn)
         
         refresh_btn = QPushButton("刷新")
-        refresh_btn.clicked.connect(self.refresh_mod_list)
+        refresh_btn.clicked.connect(self.force_refresh_mod_list)
         enabled_btn_layout.addWidget(refresh_btn)
         
         right_layout.addLayout(enabled_btn_layout)
@@ -170,48 +421,154 @@ class MainWindow(QMainWindow):
         self.status_label = QLabel("就绪")
         main_layout.addWidget(self.status_label)
     
+    def _setup_list_view(self, view):
+        """
+        设置列表视图的布局参数，避免逐行计算尺寸
+        
+        Args:
+            view: 列表视图（需已设置 ModListModel）
+        """
+        view.setUniformItemSizes(True)
+        view.setLayoutMode(QListView.LayoutMode.Batched)
+        view.setBatchSize(100)
+        view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        # 根据字体预先计算固定行高
+        view.model().set_row_height(view.fontMetrics().height() + 6)
+    
     def update_info_label(self):
         """更新信息标签"""
-        smapi_path = self.config_manager.get_smapi_path()
-        if smapi_path:
-            self.info_label.setText(f"游戏路径: {Path(smapi_path).parent}")
-        else:
-            self.info_label.setText("未配置游戏路径")
+        # 仅在配置变化后重新生成文本
+        if self._cached_info_text is None:
+            smapi_path = self.cfg.smapi_path if self.cfg else None
+            if smapi_path:
+                self._cached_info_text = f"游戏路径: {Path(smapi_path).parent}"
+            else:
+                self._cached_info_text = "未配置游戏路径"
+        self.info_label.setText(self._cached_info_text)
     
     def refresh_mod_list(self):
+        """请求刷新 Mod 列表（合并到下一轮事件循环执行）"""
+        self._refresh_pending = True
+        if not self._refresh_scheduled:
+            self._refresh_scheduled = True
+            QTimer.singleShot(0, self._flush_refresh)
+    
+    def force_refresh_mod_list(self):
+        """手动刷新：忽略目录缓存重新读取（压缩包被原地覆盖时目录修改时间不变）"""
+        self._invalidate_mod_cache()
+        self.refresh_mod_list()
+    
+    def _flush_refresh(self):
+        """执行挂起的刷新，窗口不可见时保留挂起状态"""
+        self._refresh_scheduled = False
+        if not self._refresh_pending or not self.isVisible():
+            return
+        # 上一次刷新尚未完成，结束后再执行
+        if self._refresh_running:
+            return
+        self._refresh_pending = False
+        self._do_refresh()
+    
+    def showEvent(self, event):
+        """窗口显示时执行推迟的刷新"""
+        super().showEvent(event)
+        if self._refresh_pending:
+            self._flush_refresh()
+    
+    def _do_refresh(self):
         """刷新 Mod 列表"""
         if not self.mod_manager:
             return
         
-        self.status_label.setText("正在刷新...")
-        
-        # 刷新本地 Mod 列表
-        local_mods = self.mod_manager.list_local_mods()
-        self.local_mods_list.clear()
-        
-        for mod in local_mods:
-            # 构建显示文本
-            display_name = mod['name']
-            
-            # 如果包含多个 Mod，显示数量
-            if mod.get('mod_count', 1) > 1:
-                display_name += f" ({mod['mod_count']} 个Mod)"
-            
-            # 如果已启用，添加标记
-            if mod['enabled']:
-                display_name += " [已启用]"
-            
-            item = QListWidgetItem(display_name)
-            item.setData(Qt.ItemDataRole.UserRole, mod)
-            
-            self.local_mods_list.addItem(item)
+        # 目录未变化时直接使用缓存
+        key = self._mod_dirs_key()
+        if key is not None and key == self._mod_cache_key:
+            self._populate_mod_lists(*self._mod_cache)
+            return
         
-        # 刷新已启用 Mod 列表
-        enabled_mods = self.mod_manager.list_enabled_mods()
-        self.enabled_mods_list.clear()
+        self.status_label.setText("正在刷新...")
         
-        for mod_name in enabled_mods:
-            self.enabled_mods_list.addItem(mod_name)
+        self._loading_cache_key = key
+        self._loading_generation = self._mod_cache_generation
+        self._refresh_running = True
+        self._refresh_task = ModRefreshTask(self.mod_manager)
+        self._refresh_task.signals.loaded.connect(self._on_mod_lists_loaded)
+        self._refresh_task.signals.failed.connect(self._on_mod_lists_failed)
+        self._refresh_task.signals.finished.connect(self._on_refresh_finished)
+        QThreadPool.globalInstance().start(self._refresh_task)
+    
+    def _mod_dirs_key(self):
+        """
+        获取 Mod 列表缓存的键
+        
+        Returns:
+            (本地 Mods 目录修改时间, 游戏 Mods 目录修改时间)，无法读取时返回 None
+        """
+        try:
+            return (
+                os.stat(self.mod_manager.local_mods_path).st_mtime_ns,
+                os.stat(self.mod_manager.game_mods_path).st_mtime_ns,
+            )
+        except OSError:
+            return None
+    
+    def _invalidate_mod_cache(self):
+        """使 Mod 列表缓存失效（文件系统时间精度可能无法反映刚刚发生的修改）"""
+        self._mod_cache_key = None
+        self._mod_cache_generation += 1
+    
+    def _on_mod_lists_loaded(self, local_mods, enabled_mods):
+        """后台刷新完成"""
+        self._mod_cache = (local_mods, enabled_mods)
+        # 读取期间缓存已失效，结果可能已过期，不保存缓存键
+        if self._loading_generation == self._mod_cache_generation:
+            self._mod_cache_key = self._loading_cache_key
+        else:
+            self._mod_cache_key = None
+        self._populate_mod_lists(local_mods, enabled_mods)
+    
+    def _on_mod_lists_failed(self, message):
+        """后台刷新失败"""
+        self.status_label.setText(f"刷新失败: {message}")
+    
+    def _on_refresh_finished(self):
+        """后台刷新任务结束，执行期间收到的刷新请求在此时执行"""
+        self._refresh_running = False
+        self._refresh_task = None
+        self._flush_refresh()
+    
+    def closeEvent(self, event):
+        """关闭窗口前等待后台线程结束"""
+        if self._refresh_running:
+            QThreadPool.globalInstance().waitForDone()
+        for thread in (self._add_thread, self._import_thread):
+            if thread is not None:
+                thread.wait()
+        super().closeEvent(event)
+    
+    def _populate_mod_lists(self, local_mods, enabled_mods):
+        """
+        用新数据更新两个列表
+        
+        Args:
+            local_mods: 本地 Mod 列表
+            enabled_mods: 已启用 Mod 名称列表
+        """
+        display = [_format_mod(mod) for mod in local_mods]
+        # 已启用 Mod 的名称索引（不区分大小写）
+        self._enabled_by_lower = {name.lower(): name for name in enabled_mods}
+        
+        # 更新期间暂停重绘，两个列表更新完成后统一重绘一次
+        views = (self.local_mods_list, self.enabled_mods_list)
+        for view in views:
+            view.setUpdatesEnabled(False)
+        try:
+            self.local_model.reset(local_mods, display)
+            self.enabled_model.reset(enabled_mods)
+        finally:
+            for view in views:
+                view.setUpdatesEnabled(True)
+                view.viewport().update()
         
         self.status_label.setText(f"就绪 - 本地: {len(local_mods)} 个, 已启用: {len(enabled_mods)} 个")
     
@@ -232,7 +589,7 @@ class MainWindow(QMainWindow):
             self.status_label.setText("正在添加 Mod...")
             if self.mod_manager.add_mod(file_path):
                 QMessageBox.information(self, "成功", "Mod 已添加到本地库")
-                self.refresh_mod_list()
+                self._on_mods_changed()
             else:
                 QMessageBox.critical(self, "错误", "添加 Mod 失败")
                 self.status_label.setText("添加失败")
@@ -243,12 +600,12 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "警告", "请先配置游戏路径")
             return
         
-        current_item = self.local_mods_list.currentItem()
-        if not current_item:
+        row = self.local_mods_list.currentIndex().row()
+        if row < 0:
             QMessageBox.warning(self, "警告", "请先选择一个 Mod")
             return
         
-        mod_data = current_item.data(Qt.ItemDataRole.UserRole)
+        mod_data = self.local_model.mod_at(row)
         
         if mod_data['enabled']:
             QMessageBox.information(self, "提示", "该 Mod 已启用")
@@ -265,7 +622,7 @@ class MainWindow(QMainWindow):
                 )
             else:
                 QMessageBox.information(self, "成功", f"Mod '{mod_data['name']}' 已启用")
-            self.refresh_mod_list()
+            self._on_mods_changed()
         else:
             QMessageBox.critical(self, "错误", "启用 Mod 失败")
             self.status_label.setText("启用失败")
@@ -276,12 +633,12 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "警告", "请先配置游戏路径")
             return
         
-        current_item = self.local_mods_list.currentItem()
-        if not current_item:
+        row = self.local_mods_list.currentIndex().row()
+        if row < 0:
             QMessageBox.warning(self, "警告", "请先选择一个 Mod")
             return
         
-        mod_data = current_item.data(Qt.ItemDataRole.UserRole)
+        mod_data = self.local_model.mod_at(row)
         
         if not mod_data['enabled']:
             QMessageBox.information(self, "提示", "该 Mod 未启用")
@@ -300,7 +657,7 @@ class MainWindow(QMainWindow):
             self.status_label.setText("正在禁用 Mod...")
             if self.mod_manager.disable_mod(mod_name):
                 QMessageBox.information(self, "成功", f"Mod '{mod_name}' 已禁用")
-                self.refresh_mod_list()
+                self._on_mods_changed()
             else:
                 QMessageBox.critical(self, "错误", "禁用 Mod 失败")
                 self.status_label.setText("禁用失败")
@@ -311,12 +668,12 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "警告", "请先配置游戏路径")
             return
         
-        current_item = self.enabled_mods_list.currentItem()
-        if not current_item:
+        current_index = self.enabled_mods_list.currentIndex()
+        if not current_index.isValid():
             QMessageBox.warning(self, "警告", "请先选择一个已启用的 Mod")
             return
         
-        mod_name = current_item.text()
+        mod_name = current_index.data(Qt.ItemDataRole.DisplayRole)
         
         reply = QMessageBox.question(
             self,
@@ -329,7 +686,7 @@ class MainWindow(QMainWindow):
             self.status_label.setText("正在禁用 Mod...")
             if self.mod_manager.disable_mod(mod_name):
                 QMessageBox.information(self, "成功", f"Mod '{mod_name}' 已禁用")
-                self.refresh_mod_list()
+                self._on_mods_changed()
             else:
                 QMessageBox.critical(self, "错误", "禁用 Mod 失败")
                 self.status_label.setText("禁用失败")
@@ -340,12 +697,12 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "警告", "请先配置游戏路径")
             return
         
-        current_item = self.local_mods_list.currentItem()
-        if not current_item:
+        row = self.local_mods_list.currentIndex().row()
+        if row < 0:
             QMessageBox.warning(self, "警告", "请先选择一个 Mod")
             return
         
-        mod_data = current_item.data(Qt.ItemDataRole.UserRole)
+        mod_data = self.local_model.mod_at(row)
         
         reply = QMessageBox.question(
             self,
@@ -355,15 +712,17 @@ class MainWindow(QMainWindow):
         )
         
         if reply == QMessageBox.StandardButton.Yes:
-            # 如果已启用，先禁用
+            # 如果已启用，先禁用（使用游戏目录中实际的文件夹名）
             if mod_data['enabled']:
                 self.status_label.setText("正在禁用 Mod...")
-                self.mod_manager.disable_mod(mod_data['name'])
+                self.mod_manager.disable_mod(
+                    self._enabled_by_lower.get(mod_data['name'].lower(), mod_data['name'])
+                )
             
             self.status_label.setText("正在删除 Mod...")
             if self.mod_manager.delete_local_mod(mod_data['filename']):
                 QMessageBox.information(self, "成功", f"Mod '{mod_data['name']}' 已删除")
-                self.refresh_mod_list()
+                self._on_mods_changed()
             else:
                 QMessageBox.critical(self, "错误", "删除 Mod 失败")
                 self.status_label.setText("删除失败")
@@ -372,16 +731,15 @@ class MainWindow(QMainWindow):
         """处理拖入事件"""
         if event.mimeData().hasUrls():
             # 检查是否包含 ZIP 文件
-            for url in event.mimeData().urls():
-                if url.toLocalFile().lower().endswith('.zip'):
-                    event.acceptProposedAction()
-                    return
+            if any(_is_zip(url.toLocalFile()) for url in event.mimeData().urls()):
+                event.acceptProposedAction()
+                return
         event.ignore()
     
     def dropEvent(self, event: QDropEvent):
         """处理放下事件"""
         files = [url.toLocalFile() for url in event.mimeData().urls()]
-        zip_files = [f for f in files if f.lower().endswith('.zip')]
+        zip_files = [f for f in files if _is_zip(f)]
         
         if zip_files:
             self.handle_dropped_files(zip_files)
@@ -395,17 +753,26 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "警告", "请先配置游戏路径")
             return
         
-        success_count = 0
-        fail_count = 0
-        
-        for file_path in file_paths:
-            self.status_label.setText(f"正在添加: {Path(file_path).name}...")
-            if self.mod_manager.add_mod(file_path):
-                success_count += 1
-            else:
-                fail_count += 1
+        if self._add_thread is not None and self._add_thread.isRunning():
+            QMessageBox.warning(self, "警告", "正在添加 Mod，请稍候")
+            return
         
+        self.status_label.setText(f"正在添加 {len(file_paths)} 个 Mod...")
+        self._add_thread = AddModsThread(self.mod_manager, file_paths)
+        self._add_thread.progress.connect(
+            self._on_add_mods_progress, Qt.ConnectionType.QueuedConnection
+        )
+        self._add_thread.done.connect(self._on_add_mods_done)
+        self._add_thread.start()
+    
+    def _on_add_mods_progress(self, done, total, name):
+        """拖放添加进度"""
+        self.status_label.setText(f"正在添加 ({done}/{total}): {name}")
+    
+    def _on_add_mods_done(self, success_count, fail_count):
+        """拖放添加完成"""
         # 刷新列表
+        self._invalidate_mod_cache()
         self.refresh_mod_list()
         
         # 显示结果
@@ -448,30 +815,70 @@ class MainWindow(QMainWindow):
         if reply == QMessageBox.StandardButton.No:
             # 用户选择不导入，标记为已处理
             self.config_manager.set_existing_mods_imported(True)
+            self._update_config_snapshot()
             return
         
-        # 显示进度对话框
-        from PyQt6.QtWidgets import QProgressDialog
-        progress = QProgressDialog("正在导入现有 Mod...", None, 0, 0, self)
+        # 显示进度对话框（总数未知前为不确定进度）
+        progress = QProgressDialog("正在导入现有 Mod...", "取消", 0, 0, self)
         progress.setWindowTitle("导入 Mod")
         progress.setWindowModality(Qt.WindowModality.WindowModal)
         progress.setMinimumDuration(0)
-        progress.setCancelButton(None)
         progress.show()
-        
-        # 执行导入
-        from PyQt6.QtCore import QTimer
-        QTimer.singleShot(100, lambda: self._do_import_existing_mods(progress))
+        self._import_progress = progress
+        
+        # 在后台线程中执行导入，线程结束后再处理结果
+        self._import_thread = ImportExistingThread(self.mod_manager)
+        progress.canceled.connect(self._import_thread.cancel)
+        self._import_thread.progress.connect(self._on_import_progress)
+        self._import_thread.finished.connect(self._on_import_finished)
+        self._import_thread.start()
+    
+    def _on_import_progress(self, current, total, name):
+        """导入进度"""
+        # 模态进度框的 setValue 会处理事件，期间导入可能已经结束并关闭进度框，
+        # 因此先更新文本，setValue 之后不再访问进度框
+        progress = self._import_progress
+        if progress is None or progress.wasCanceled():
+            return
+        progress.setLabelText(f"已导入: {name}")
+        progress.setRange(0, total)
+        progress.setValue(current)
     
-    def _do_import_existing_mods(self, progress_dialog):
-        """执行导入现有 Mod 的操作"""
-        result = self.mod_manager.import_existing_mods()
-        progress_dialog.close()
+    def _on_import_finished(self):
+        """导入线程结束"""
+        result = self._import_thread.result
+        if self._import_progress is not None:
+            progress = self._import_progress
+            self._import_progress = None
+            progress.close()
+        
+        if result is None:
+            QMessageBox.critical(self, "错误", "导入现有 Mod 失败")
+            self._invalidate_mod_cache()
+            self.refresh_mod_list()
+            return
         
+        if result['cancelled']:
+            # 未标记为已导入，下次启动时可继续导入（已导入的 Mod 会自动跳过）
+            self._invalidate_mod_cache()
+            self.refresh_mod_list()
+            QMessageBox.information(
+                self,
+                "导入已取消",
+                f"已导入 {result['success']} 个 Mod，下次启动时可继续导入剩余的 Mod。"
+            )
+            return
+        
+        self._do_import_existing_mods(result)
+    
+    def _do_import_existing_mods(self, result):
+        """导入现有 Mod 完成后的处理"""
         # 标记为已导入
         self.config_manager.set_existing_mods_imported(True)
+        self._update_config_snapshot()
         
         # 刷新列表
+        self._invalidate_mod_cache()
         self.refresh_mod_list()
         
         # 显示结果
@@ -6,23 +6,32 @@ from PyQt6.QtWidgets import (
     QPushButton, QLineEdit, QFileDialog, QMessageBox,
     QProgressBar
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
+from PyQt6.QtCore import Qt, QObject, QRunnable, QThreadPool, pyqtSignal
 from pathlib import Path
 
 from backend.file_finder import FileFinder
 
 
-class FindSmapiThread(QThread):
-    """查找 SMAPI 的线程"""
+class FindSmapiSignals(QObject):
+    """查找 SMAPI 任务的信号"""
     found = pyqtSignal(str)
     not_found = pyqtSignal()
+
+
+class FindSmapiTask(QRunnable):
+    """查找 SMAPI 的任务（在全局线程池中运行）"""
+    
+    def __init__(self, hint=None):
+        super().__init__()
+        self.hint = hint
+        self.signals = FindSmapiSignals()
     
     def run(self):
-        smapi_path = FileFinder.find_smapi_exe()
+        smapi_path = FileFinder.find_smapi_exe(self.hint)
         if smapi_path:
-            self.found.emit(smapi_path)
+            self.signals.found.emit(smapi_path)
         else:
-            self.not_found.emit()
+            self.signals.not_found.emit()
 
 
 class SetupDialog(QDialog):
@@ -110,10 +119,16 @@ class SetupDialog(QDialog):
         self.progress_bar.show()
         self.status_label.setText("正在自动查找 StardewModdingAPI.exe...")
         
-        self.find_thread = FindSmapiThread()
-        self.find_thread.found.connect(self.on_smapi_found)
-        self.find_thread.not_found.connect(self.on_smapi_not_found)
-        self.find_thread.start()
+        # 上次找到的路径仍然有效时，后台任务直接返回该路径而不搜索磁盘
+        self.find_task = FindSmapiTask(self.config_manager.get_last_smapi_hint())
+        self.find_task.signals.found.connect(self.on_smapi_searched)
+        self.find_task.signals.not_found.connect(self.on_smapi_not_found)
+        QThreadPool.globalInstance().start(self.find_task)
+    
+    def on_smapi_searched(self, smapi_path):
+        """SMAPI 搜索成功，记录路径供下次使用"""
+        self.config_manager.set_last_smapi_hint(smapi_path)
+        self.on_smapi_found(smapi_path)
     
     def on_smapi_found(self, smapi_path):
         """SMAPI 查找成功"""
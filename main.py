@@ -4,6 +4,7 @@
 """
 import sys
 from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import QTimer
 from frontend.main_window import MainWindow
 
 
@@ -12,9 +13,10 @@ def main():
     app = QApplication(sys.argv)
     app.setApplicationName("星露谷 Mod 管理器")
     
-    # 创建并显示主窗口
-    window = MainWindow()
+    # 创建并显示主窗口，窗口显示后再读取配置和扫描 Mod
+    window = MainWindow(deferred=True)
     window.show()
+    QTimer.singleShot(0, window.post_show_init)
     
     sys.exit(app.exec())
 